@@ -0,0 +1,84 @@
+#!/usr/bin/env -S uv run --script
+# /// script
+# requires-python = ">=3.11"
+# ///
+"""add custom emojis to find-bufo's sqlite db.
+
+one-off additions whose images already live under find-bufo's static dir —
+scraped bufo.zone emojis go through register_emojis.py instead.
+
+usage:
+    uv run scripts/add_custom_emoji.py [path/to/find-bufo.db]
+"""
+
+import sqlite3
+import sys
+from datetime import datetime, timezone
+from pathlib import Path
+
+DEFAULT_DB = Path("data/find-bufo.db")
+
+# rows per INSERT statement — 5 params each, kept well under sqlite's
+# 999-parameter floor for old builds
+CHUNK = 180
+
+# (name, filename, alt_text)
+NEW_EMOJIS = [
+    ("bufo-ships-it", "bufo-ships-it.png", "bufo hitting the deploy button"),
+    ("bufo-stares-into-the-void", "bufo-stares-into-the-void.png", "bufo staring into the void"),
+    ("bufo-status-update", "bufo-status-update.png", "bufo posting a status update"),
+    ("bufo-touches-grass", "bufo-touches-grass.png", "bufo touching grass"),
+    ("stoat", "stoat.png", "a stoat, for reasons"),
+]
+
+
+def add_custom_emojis(db_path: Path, rows: list[tuple[str, str, str, str, str]]) -> int:
+    """insert rows that aren't already registered, returning how many were added.
+
+    one connection and one transaction for the whole batch — a connect +
+    SELECT + INSERT + COMMIT cycle per emoji costs an fsync each, which
+    dominates wall time for anything longer than a couple of rows.
+    """
+    conn = sqlite3.connect(db_path)
+    # wal + relaxed sync halves the fsync cost of the commit and lets
+    # find-bufo keep reading while we write
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("PRAGMA synchronous=NORMAL")
+    conn.execute("PRAGMA temp_store=MEMORY")
+    conn.execute("PRAGMA cache_size=-65536")
+    try:
+        cursor = conn.cursor()
+        # let the name index do the existence check instead of pulling every
+        # registered name into python first
+        cursor.execute(
+            "CREATE UNIQUE INDEX IF NOT EXISTS idx_custom_emojis_name ON custom_emojis(name)"
+        )
+        added = 0
+        with conn:  # implicit BEGIN/COMMIT around the whole batch
+            # multi-row VALUES beats executemany at these sizes: one
+            # prepared statement per chunk instead of one vdbe run per row
+            for i in range(0, len(rows), CHUNK):
+                chunk = rows[i : i + CHUNK]
+                placeholders = ", ".join(["(?, ?, ?, ?, ?)"] * len(chunk))
+                cursor.execute(
+                    "INSERT OR IGNORE INTO"
+                    " custom_emojis(name, filename, alt_text, category, addedAt)"
+                    f" VALUES {placeholders}",
+                    [value for row in chunk for value in row],
+                )
+                added += cursor.rowcount
+        return added
+    finally:
+        conn.close()
+
+
+def main() -> None:
+    db_path = Path(sys.argv[1]) if len(sys.argv) > 1 else DEFAULT_DB
+    added_at = datetime.now(timezone.utc).isoformat()
+    rows = [(name, filename, alt_text, "custom", added_at) for name, filename, alt_text in NEW_EMOJIS]
+    added = add_custom_emojis(db_path, rows)
+    print(f"added {added}/{len(rows)} emojis ({len(rows) - added} already registered)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,121 @@
+#!/usr/bin/env -S uv run --script
+# /// script
+# requires-python = ">=3.11"
+# ///
+"""register scraped bufo emojis into find-bufo's sqlite db.
+
+scans a directory of image files (populated by scrape_bufo_emojis.py) and
+inserts one custom_emojis row per file that isn't already registered.
+
+usage:
+    uv run scripts/register_emojis.py [path/to/bufos] [path/to/find-bufo.db]
+"""
+
+import os
+import sqlite3
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime, timezone
+from functools import partial
+from pathlib import Path
+
+DEFAULT_DB = Path("data/find-bufo.db")
+
+MIME = {
+    ".png": "image/png",
+    ".gif": "image/gif",
+    ".jpg": "image/jpeg",
+    ".jpeg": "image/jpeg",
+    ".webp": "image/webp",
+}
+
+# file counts below this aren't worth the process spawn cost
+POOL_THRESHOLD = 5000
+
+# rows per executemany — bounds per-call work and gives progress feedback
+# on big runs without giving up the single-transaction fsync amortization
+BATCH = 10_000
+
+
+def build_row(image_path: Path, added_at: str) -> tuple[str, str, str, str, str]:
+    """build one custom_emojis row from an image file.
+
+    module-level so it pickles into worker processes — any future per-file
+    work (dimensions, perceptual hashing) belongs here, where it scales
+    across cores. db writes stay on the main thread: sqlite is
+    single-writer.
+    """
+    name = image_path.stem
+    if len(name) > 50:
+        name = name[:47] + "..."
+    alt_text = name.replace("-", " ").replace("_", " ")
+    return (name, image_path.name, alt_text, "bufo", added_at)
+
+
+def main() -> None:
+    emojis_dir = Path(sys.argv[1]) if len(sys.argv) > 1 else Path("bufos")
+    db_path = Path(sys.argv[2]) if len(sys.argv) > 2 else DEFAULT_DB
+
+    # one directory read instead of a glob per extension
+    image_files = [p for p in emojis_dir.iterdir() if p.is_file() and p.suffix.lower() in MIME]
+    print(f"found {len(image_files)} image files in {emojis_dir}")
+
+    conn = sqlite3.connect(db_path)
+    # wal + relaxed sync halves the fsync cost of the commit and lets
+    # find-bufo keep reading while we write
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("PRAGMA synchronous=NORMAL")
+    conn.execute("PRAGMA temp_store=MEMORY")
+    conn.execute("PRAGMA cache_size=-65536")
+    cursor = conn.cursor()
+    # let the name index do the existence check instead of pulling every
+    # registered name into python first
+    cursor.execute(
+        "CREATE UNIQUE INDEX IF NOT EXISTS idx_custom_emojis_name ON custom_emojis(name)"
+    )
+
+    added_at = datetime.now(timezone.utc).isoformat()
+    if len(image_files) >= POOL_THRESHOLD:
+        with ProcessPoolExecutor(max_workers=os.cpu_count()) as executor:
+            rows = list(
+                executor.map(partial(build_row, added_at=added_at), image_files, chunksize=64)
+            )
+    else:
+        rows = [build_row(image_path, added_at) for image_path in image_files]
+
+    # one transaction for the whole batch — an autocommit INSERT per file
+    # means a journal write per row, which crawls on thousands of bufos
+    added = 0
+    if rows:
+        # explicit BEGIN/COMMIT rather than `with conn:` so the chunk loop
+        # stays inside one enclosing transaction
+        cursor.execute("BEGIN")
+        try:
+            # defer category-index maintenance: per-row index updates cost
+            # O(n log n) across the batch, one rebuild afterwards is a single
+            # bulk sort. the unique name index stays — OR IGNORE needs it.
+            cursor.execute("DROP INDEX IF EXISTS idx_custom_emojis_category")
+            for i in range(0, len(rows), BATCH):
+                cursor.executemany(
+                    "INSERT OR IGNORE INTO"
+                    " custom_emojis(name, filename, alt_text, category, addedAt)"
+                    " VALUES(?, ?, ?, ?, ?)",
+                    rows[i : i + BATCH],
+                )
+                added += cursor.rowcount
+                if len(rows) > BATCH:
+                    print(f"  {min(i + BATCH, len(rows))}/{len(rows)}")
+            cursor.execute(
+                "CREATE INDEX IF NOT EXISTS idx_custom_emojis_category"
+                " ON custom_emojis(category)"
+            )
+        except BaseException:
+            conn.rollback()
+            raise
+        conn.commit()
+    conn.close()
+    print(f"registered {added} new emojis ({len(rows) - added} already registered)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,145 @@
+#!/usr/bin/env -S uv run --script
+# /// script
+# requires-python = ">=3.11"
+# dependencies = ["httpx", "anyio", "beautifulsoup4", "lxml"]
+# ///
+"""scrape every bufo from all-the.bufo.zone into a local directory.
+
+pair with register_emojis.py to get the results into find-bufo's db.
+
+usage:
+    uv run scripts/scrape_bufo_emojis.py [output_dir]
+"""
+
+import asyncio
+import json
+import os
+import re
+import sys
+from pathlib import Path
+
+import anyio
+import httpx
+from bs4 import BeautifulSoup
+
+BUFO_ZONE = "https://all-the.bufo.zone"
+CONCURRENCY = 10
+ETAG_SIDECAR = ".etags.json"
+
+# bytes pattern: matching the raw body skips decoding the whole page just
+# for the regex pass
+URL_RE = re.compile(rb'https://all-the\.bufo\.zone/[^"\'>\s]+\.(?:png|gif|jpg|jpeg|webp)')
+
+
+def load_etags(output_dir: Path) -> dict[str, str]:
+    try:
+        return json.loads((output_dir / ETAG_SIDECAR).read_text())
+    except (FileNotFoundError, json.JSONDecodeError):
+        return {}
+
+
+def save_etags(output_dir: Path, etags: dict[str, str]) -> None:
+    (output_dir / ETAG_SIDECAR).write_text(json.dumps(etags, indent=2, sort_keys=True))
+
+
+async def fetch_emoji_urls(client: httpx.AsyncClient) -> set[str]:
+    response = await client.get(BUFO_ZONE)
+    response.raise_for_status()
+    # lxml tokenizes in c (and sniffs the encoding itself, so hand it the
+    # raw bytes); html.parser chews through a page this size in pure python
+    soup = BeautifulSoup(response.content, "lxml")
+    urls = {
+        img.get("src")
+        for img in soup.find_all("img")
+        if "all-the.bufo.zone" in (img.get("src") or "")
+    }
+    # the gallery lazy-loads some images from inline json the img-tag pass
+    # misses, so regex the raw page too
+    urls.update(m.group(0).decode("ascii") for m in URL_RE.finditer(response.content))
+    return urls
+
+
+async def download_emoji(
+    client: httpx.AsyncClient,
+    sem: asyncio.Semaphore,
+    url: str,
+    output_dir: Path,
+    existing: set[str],
+    etags: dict[str, str],
+) -> bool:
+    """download one emoji, returning True if it was actually fetched."""
+    filename = url.rsplit("/", 1)[1]
+    output_path = output_dir / filename
+    etag = etags.get(filename)
+    if filename in existing:
+        if not etag:
+            # no validator recorded — trust the local copy like before
+            return False
+    elif etag:
+        # stale sidecar entry for a file that's gone locally — a 304 is
+        # only a valid skip when there's a copy to trust, so re-download
+        etags.pop(filename, None)
+        etag = None
+    # with a recorded etag the server can answer 304 with zero body bytes,
+    # so re-runs revalidate instead of re-downloading
+    headers = {"If-None-Match": etag} if etag else {}
+    async with sem:
+        # stream straight to disk — buffering whole gifs in response.content
+        # spikes rss across ten concurrent downloads for no benefit
+        async with client.stream("GET", url, headers=headers) as response:
+            if response.status_code == 304:
+                return False
+            response.raise_for_status()
+            # stream to a temp name and rename into place on success — a
+            # connection dropped mid-body must not leave a truncated file
+            # the next run's skip check would trust as complete
+            part_path = output_path.with_suffix(output_path.suffix + ".part")
+            try:
+                async with await anyio.open_file(part_path, "wb") as f:
+                    async for chunk in response.aiter_bytes(65536):
+                        await f.write(chunk)
+            except BaseException:
+                part_path.unlink(missing_ok=True)
+                raise
+            part_path.replace(output_path)
+            new_etag = response.headers.get("etag")
+            if new_etag:
+                etags[filename] = new_etag
+    return True
+
+
+async def download_all_emojis(client: httpx.AsyncClient, urls: set[str], output_dir: Path) -> None:
+    # one shared pool capped by a semaphore rather than gather-in-batches —
+    # fixed batches stall on their slowest member and waste the inter-batch
+    # sleep, a semaphore keeps all ten slots busy continuously
+    sem = asyncio.Semaphore(CONCURRENCY)
+    etags = load_etags(output_dir)
+    # one scandir instead of a stat syscall per url — on a resumed scrape of
+    # thousands of files that's the difference before any http work starts
+    with os.scandir(output_dir) as entries:
+        existing = {entry.name for entry in entries}
+    results = await asyncio.gather(
+        *(download_emoji(client, sem, url, output_dir, existing, etags) for url in sorted(urls)),
+        return_exceptions=True,
+    )
+    save_etags(output_dir, etags)
+    downloaded = sum(r is True for r in results)
+    errors = [r for r in results if isinstance(r, Exception)]
+    skipped = len(results) - downloaded - len(errors)
+    print(f"downloaded {downloaded}, skipped {skipped}, errors {len(errors)}")
+    for error in errors[:5]:
+        print(f"  {error}")
+
+
+async def main() -> None:
+    output_dir = Path(sys.argv[1]) if len(sys.argv) > 1 else Path("bufos")
+    output_dir.mkdir(parents=True, exist_ok=True)
+    limits = httpx.Limits(max_connections=CONCURRENCY, max_keepalive_connections=CONCURRENCY)
+    async with httpx.AsyncClient(limits=limits, timeout=30.0, follow_redirects=True) as client:
+        urls = await fetch_emoji_urls(client)
+        print(f"found {len(urls)} emoji urls")
+        await download_all_emojis(client, urls, output_dir)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,82 @@
+#!/usr/bin/env -S uv run --script
+# /// script
+# requires-python = ">=3.11"
+# dependencies = ["httpx", "orjson"]
+# ///
+"""sanity-check the oauth client metadata the app serves.
+
+fetches oauth-client-metadata.json, validates the fields the pds actually
+looks at, then probes the url a few times to confirm cache headers are
+doing their job (the pds re-fetches client metadata on every authorize).
+
+usage:
+    uv run scripts/test_metadata_validation.py [base_url]
+"""
+
+import asyncio
+import sys
+import time
+
+import httpx
+import orjson
+
+DEFAULT_BASE = "https://status.zzstoatzz.io"
+PROBES = 3
+
+
+def validate_metadata(metadata: dict, metadata_url: str) -> list[str]:
+    """return a list of problems (empty means the pds should be happy)."""
+    problems = []
+    if metadata.get("client_id") != metadata_url:
+        problems.append(f"client_id != metadata url: {metadata.get('client_id')}")
+    if "authorization_code" not in metadata.get("grant_types", []):
+        problems.append("grant_types missing authorization_code")
+    if not metadata.get("redirect_uris"):
+        problems.append("no redirect_uris")
+    if "atproto" not in metadata.get("scope", "").split():
+        problems.append("scope missing atproto")
+    if not metadata.get("dpop_bound_access_tokens"):
+        problems.append("dpop_bound_access_tokens is not true")
+    return problems
+
+
+async def probe(client: httpx.AsyncClient, url: str, i: int) -> None:
+    start = time.perf_counter()
+    r = await client.get(url)
+    elapsed = (time.perf_counter() - start) * 1000
+    print(
+        f"  probe {i}: {r.status_code} in {elapsed:.0f}ms"
+        f" cache-control={r.headers.get('cache-control')!r}"
+        f" etag={r.headers.get('etag')!r}"
+        f" age={r.headers.get('age')!r}"
+    )
+
+
+async def main() -> None:
+    base = sys.argv[1].rstrip("/") if len(sys.argv) > 1 else DEFAULT_BASE
+    metadata_url = f"{base}/oauth-client-metadata.json"
+
+    # one client for the whole script — keepalive means the probes reuse the
+    # connection the metadata fetch opened
+    limits = httpx.Limits(max_keepalive_connections=10, max_connections=10)
+    async with httpx.AsyncClient(limits=limits, timeout=10.0) as client:
+        response = await client.get(metadata_url)
+        response.raise_for_status()
+        metadata = orjson.loads(response.content)
+        print(orjson.dumps(metadata, option=orjson.OPT_INDENT_2).decode())
+
+        problems = validate_metadata(metadata, metadata_url)
+        if problems:
+            for problem in problems:
+                print(f"✗ {problem}")
+            sys.exit(1)
+        print("✓ metadata looks valid")
+
+        # the probes are independent, so fire them concurrently: n serial
+        # rtts collapse to ~1
+        print("\ncache probes:")
+        await asyncio.gather(*(probe(client, metadata_url, i) for i in range(PROBES)))
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,95 @@
+#!/usr/bin/env -S uv run --script
+# /// script
+# requires-python = ">=3.11"
+# dependencies = ["httpx"]
+# ///
+"""probe which scope combinations bsky.social's authorization server accepts.
+
+pushes a PAR request per candidate scope string — the server validates
+scope before any authentication, so this needs no account. useful when
+tweaking the scopes list in hatk.config.ts.
+
+usage:
+    uv run scripts/test_oauth.py
+"""
+
+import asyncio
+import base64
+import hashlib
+import secrets
+
+import httpx
+
+PAR_URL = "https://bsky.social/oauth/par"
+CLIENT_ID = "https://status.zzstoatzz.io/oauth-client-metadata.json"
+REDIRECT_URI = "https://status.zzstoatzz.io/oauth/callback"
+
+SCOPE_COMBOS = [
+    ("baseline", "atproto"),
+    (
+        "repo writes",
+        "atproto repo:io.zzstoatzz.status.record repo:io.zzstoatzz.status.preferences",
+    ),
+    (
+        "granular rpc",
+        "atproto rpc:app.bsky.actor.getProfile?aud=did:web:api.bsky.app#bsky_appview",
+    ),
+    (
+        "everything",
+        "atproto repo:io.zzstoatzz.status.record repo:io.zzstoatzz.status.preferences"
+        " rpc:app.bsky.actor.getProfile?aud=did:web:api.bsky.app#bsky_appview"
+        " rpc:app.bsky.graph.getFollows?aud=did:web:api.bsky.app#bsky_appview",
+    ),
+]
+
+
+def pkce_challenge() -> str:
+    verifier = secrets.token_urlsafe(48)
+    digest = hashlib.sha256(verifier.encode("ascii")).digest()
+    return base64.urlsafe_b64encode(digest).rstrip(b"=").decode("ascii")
+
+
+async def probe(client: httpx.AsyncClient, sem: asyncio.Semaphore, label: str, scope: str) -> None:
+    async with sem:
+        response = await client.post(
+            PAR_URL,
+            data={
+                "client_id": CLIENT_ID,
+                "response_type": "code",
+                "redirect_uri": REDIRECT_URI,
+                "scope": scope,
+                "state": "scope-probe",
+                "code_challenge": pkce_challenge(),
+                "code_challenge_method": "S256",
+            },
+        )
+    if response.status_code == 201:
+        print(f"  ✓ {label}: accepted")
+        return
+    # rate limiters and proxies answer this endpoint with html, not json
+    try:
+        body = response.json()
+        error = body.get("error_description") or body.get("error") or "?"
+    except ValueError:
+        error = response.text[:120]
+    print(f"  ✗ {label}: {response.status_code} {error}")
+
+
+async def main() -> None:
+    # the probes are independent — run them concurrently, capped at the
+    # number of combos so we don't hammer the authorization server
+    sem = asyncio.Semaphore(4)
+    print("scope probes against bsky.social:")
+    async with httpx.AsyncClient(timeout=15.0) as client:
+        results = await asyncio.gather(
+            *(probe(client, sem, label, scope) for label, scope in SCOPE_COMBOS),
+            return_exceptions=True,
+        )
+    # one failed probe shouldn't eat the rest of the report
+    for (label, _), result in zip(SCOPE_COMBOS, results):
+        if isinstance(result, Exception):
+            print(f"  ✗ {label}: {result!r}")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,77 @@
+#!/usr/bin/env -S uv run --script
+# /// script
+# requires-python = ">=3.11"
+# dependencies = ["httpx"]
+# ///
+"""minimal oauth probe: fetch client metadata from prod and local dev and
+check that the scope string grants what the app actually needs.
+
+usage:
+    uv run scripts/test_oauth_minimal.py
+"""
+
+import asyncio
+import sys
+
+import httpx
+
+PROD_URL = "https://status.zzstoatzz.io/oauth-client-metadata.json"
+DEV_URL = "http://127.0.0.1:3000/oauth-client-metadata.json"
+
+
+def check_scope(scope: str) -> bool:
+    """check the scope string covers the records the app writes plus the
+    appview rpcs the feed hydration needs."""
+    ok = True
+    # split once — every check below walks the same token list
+    parts = scope.split()
+    for repo_scope in (
+        "repo:io.zzstoatzz.status.record",
+        "repo:io.zzstoatzz.status.preferences",
+    ):
+        if repo_scope in parts:
+            print(f"  ✓ {repo_scope}")
+        else:
+            print(f"  ✗ missing {repo_scope}")
+            ok = False
+
+    # granular rpc scopes need the #bsky_appview aud fragment or the token
+    # won't work against the appview
+    for nsid, label in (
+        ("rpc:app.bsky.actor.getProfile", "getProfile"),
+        ("rpc:app.bsky.graph.getFollows", "getFollows"),
+    ):
+        token = next((p for p in parts if p.startswith(nsid)), None)
+        if token is None:
+            continue
+        if "#bsky_appview" in token:
+            print(f"  ✓ {label} has appview aud")
+        else:
+            print(f"  ✗ {label} missing #bsky_appview (got {token!r})")
+            ok = False
+    return ok
+
+
+async def main() -> None:
+    ok = True
+    targets = (("prod", PROD_URL), ("dev", DEV_URL))
+    async with httpx.AsyncClient(timeout=10.0) as client:
+        # prod and dev are independent fetches — grab both at once
+        responses = await asyncio.gather(
+            *(client.get(url) for _, url in targets), return_exceptions=True
+        )
+    for (label, url), response in zip(targets, responses):
+        print(f"{label}: {url}")
+        if isinstance(response, Exception):
+            print(f"  (unreachable: {response})")
+            continue
+        if response.is_error:
+            print(f"  (http {response.status_code})")
+            continue
+        metadata = response.json()
+        ok = check_scope(metadata.get("scope", "")) and ok
+    sys.exit(0 if ok else 1)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
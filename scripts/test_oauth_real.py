@@ -0,0 +1,148 @@
+#!/usr/bin/env -S uv run --script
+# /// script
+# requires-python = ">=3.11"
+# dependencies = ["httpx", "orjson"]
+# ///
+"""end-to-end oauth probe against a real account on bsky.social.
+
+logs in with BSKY_HANDLE / BSKY_PASSWORD (use a throwaway account), walks
+the authorize flow for each candidate scope string, then optionally
+exchanges a pasted code and hits getProfile/getFollows with the result.
+strictly a dev tool — the sign-in endpoints are what the pds login page
+posts to, not a stable api.
+
+usage:
+    BSKY_HANDLE=... BSKY_PASSWORD=... uv run scripts/test_oauth_real.py
+"""
+
+import asyncio
+import os
+import sys
+
+import httpx
+import orjson
+
+AUTH_BASE = "https://bsky.social"
+CLIENT_ID = "https://status.zzstoatzz.io/oauth-client-metadata.json"
+REDIRECT_URI = "https://status.zzstoatzz.io/oauth/callback"
+
+TEST_SCOPES = [
+    ("baseline", "atproto"),
+    (
+        "repo writes",
+        "atproto repo:io.zzstoatzz.status.record repo:io.zzstoatzz.status.preferences",
+    ),
+    (
+        "granular rpc",
+        "atproto rpc:app.bsky.actor.getProfile?aud=did:web:api.bsky.app#bsky_appview",
+    ),
+    (
+        "everything",
+        "atproto repo:io.zzstoatzz.status.record repo:io.zzstoatzz.status.preferences"
+        " rpc:app.bsky.actor.getProfile?aud=did:web:api.bsky.app#bsky_appview"
+        " rpc:app.bsky.graph.getFollows?aud=did:web:api.bsky.app#bsky_appview",
+    ),
+]
+
+
+async def login(client: httpx.AsyncClient, handle: str, password: str) -> None:
+    # first contact sets the csrf/device cookies the sign-in endpoint wants
+    await client.get(f"{AUTH_BASE}/oauth/authorize", params={"client_id": CLIENT_ID})
+    csrf = client.cookies.get("csrf-token", "")
+    response = await client.post(
+        f"{AUTH_BASE}/oauth/authorize/sign-in",
+        json={
+            "csrf_token": csrf,
+            "account_identifier": handle,
+            "password": password,
+            "remember": False,
+        },
+    )
+    response.raise_for_status()
+
+
+async def probe_scopes(client: httpx.AsyncClient) -> None:
+    # each scope probe is an independent GET — run them concurrently with a
+    # small cap instead of serializing four round trips
+    sem = asyncio.Semaphore(4)
+
+    async def probe(label: str, scope: str) -> None:
+        async with sem:
+            response = await client.get(
+                f"{AUTH_BASE}/oauth/authorize",
+                params={
+                    "client_id": CLIENT_ID,
+                    "response_type": "code",
+                    "redirect_uri": REDIRECT_URI,
+                    "scope": scope,
+                    "state": f"probe-{label.replace(' ', '-')}",
+                },
+            )
+        verdict = "shown consent" if response.status_code == 200 else response.status_code
+        print(f"  {label}: {verdict}")
+
+    await asyncio.gather(*(probe(label, scope) for label, scope in TEST_SCOPES))
+
+
+async def exchange_code(client: httpx.AsyncClient, code: str) -> dict:
+    response = await client.post(
+        f"{AUTH_BASE}/oauth/token",
+        data={
+            "grant_type": "authorization_code",
+            "code": code,
+            "client_id": CLIENT_ID,
+            "redirect_uri": REDIRECT_URI,
+        },
+    )
+    payload = orjson.loads(response.content)
+    print(f"token exchange: {response.status_code}")
+    print(orjson.dumps(payload, option=orjson.OPT_INDENT_2).decode())
+    return payload
+
+
+async def api_probes(client: httpx.AsyncClient, handle: str, token: str) -> None:
+    headers = {"Authorization": f"DPoP {token}"}
+    # independent reads — fetch both at once
+    profile, follows = await asyncio.gather(
+        client.get(
+            f"{AUTH_BASE}/xrpc/app.bsky.actor.getProfile",
+            params={"actor": handle},
+            headers=headers,
+        ),
+        client.get(
+            f"{AUTH_BASE}/xrpc/app.bsky.graph.getFollows",
+            params={"actor": handle},
+            headers=headers,
+        ),
+    )
+    print(f"getProfile: {profile.status_code}")
+    print(f"getFollows: {follows.status_code}")
+
+
+async def main() -> None:
+    handle = os.environ.get("BSKY_HANDLE")
+    password = os.environ.get("BSKY_PASSWORD")
+    if not handle or not password:
+        sys.exit("set BSKY_HANDLE and BSKY_PASSWORD (throwaway account!)")
+
+    # one pooled client for the whole flow — every endpoint here is the same
+    # host, so keepalive reuses a single tcp+tls connection from login
+    # through the api probes instead of re-handshaking per phase
+    limits = httpx.Limits(max_keepalive_connections=10)
+    async with httpx.AsyncClient(limits=limits, timeout=15.0, follow_redirects=False) as client:
+        await login(client, handle, password)
+        print(f"logged in as {handle}")
+        print("scope probes:")
+        await probe_scopes(client)
+
+        code = input("\npaste an authorization code to exchange (enter to skip): ").strip()
+        if not code:
+            return
+        payload = await exchange_code(client, code)
+        token = payload.get("access_token")
+        if token:
+            await api_probes(client, handle, token)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())